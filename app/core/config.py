@@ -8,14 +8,26 @@ class Settings(BaseSettings):
     APP_NAME: str = "S1C0N API"
     DEBUG: bool = True
     
-    # Database
+    # Database (SQLite for development; PostgreSQL in production for JSONB/GIN on scan results)
     DATABASE_URL: str = "sqlite:///./s1c0n.db"
+    # Connection pool; size for concurrent scans, reports and WebSocket clients
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 40
+    DB_POOL_RECYCLE: int = 1800  # seconds
+    RUN_MIGRATIONS: bool = True  # create tables at startup
+    
+    # Reports
+    REPORT_WORKERS: Optional[int] = None  # PDF render processes; None = CPU count
     
     # JWT
     SECRET_KEY: str = secrets.token_urlsafe(32)
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60 * 24  # 24 hours
     
+    # Encryption of stored secrets (Gemini API keys); must stay the same across restarts.
+    # Falls back to SECRET_KEY when that is set explicitly; the generated default is never used.
+    ENCRYPTION_KEY: Optional[str] = None
+    
     # CORS
     FRONTEND_URL: str = "http://localhost:5173"
     
@@ -3,9 +3,23 @@ from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from app.core.config import settings
 
+is_sqlite = settings.DATABASE_URL.startswith("sqlite")
+
+# check_same_thread is a SQLite-only connect arg
+connect_args = {"check_same_thread": False} if is_sqlite else {}
+
+# SQLite in-memory URLs use SingletonThreadPool, which rejects QueuePool sizing
+pool_args = {} if is_sqlite else {
+    "pool_size": settings.DB_POOL_SIZE,
+    "max_overflow": settings.DB_MAX_OVERFLOW,
+}
+
 engine = create_engine(
     settings.DATABASE_URL, 
-    connect_args={"check_same_thread": False}
+    connect_args=connect_args,
+    pool_pre_ping=True,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    **pool_args
 )
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
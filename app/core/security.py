@@ -1,10 +1,13 @@
 from datetime import datetime, timedelta
 from typing import Optional
+import time
+from cachetools import TTLCache
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from sqlalchemy.orm import Session
+from sqlalchemy import event
+from sqlalchemy.orm import Session, make_transient_to_detached
 from app.core.config import settings
 from app.core.database import get_db
 from app.models.user import User
@@ -12,6 +15,12 @@ from app.models.user import User
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/login")
 
+# Decoded token payloads and user rows, shared across requests. ORM updates to a User in this
+# process drop its entry at once; changes from other workers or raw SQL apply within AUTH_CACHE_TTL.
+AUTH_CACHE_TTL = 300  # seconds
+_token_cache: TTLCache = TTLCache(maxsize=10_000, ttl=AUTH_CACHE_TTL)
+_user_cache: TTLCache = TTLCache(maxsize=10_000, ttl=AUTH_CACHE_TTL)
+
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
@@ -29,11 +38,28 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     return encoded_jwt
 
 def decode_token(token: str) -> Optional[dict]:
+    payload = _token_cache.get(token)
+    if payload is not None:
+        # Cached entries may outlive the token itself
+        if payload.get("exp", 0) > time.time():
+            return payload
+        _token_cache.pop(token, None)
+        return None
     try:
         payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
-        return payload
     except JWTError:
         return None
+    _token_cache[token] = payload
+    return payload
+
+def invalidate_user_cache(user_id: int) -> None:
+    """Drop a cached user row so the next request reloads it."""
+    _user_cache.pop(user_id, None)
+
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _invalidate_changed_user(mapper, connection, target: User) -> None:
+    invalidate_user_cache(target.id)
 
 async def get_current_user(
     token: str = Depends(oauth2_scheme),
@@ -52,8 +78,18 @@ async def get_current_user(
     if user_id is None:
         raise credentials_exception
     
-    user = db.query(User).filter(User.id == int(user_id)).first()
+    user_id = int(user_id)
+    cached = _user_cache.get(user_id)
+    if cached is not None:
+        # Attach a copy of the cached row to this session without a SELECT
+        return db.merge(cached, load=False)
+    
+    user = db.query(User).filter(User.id == user_id).first()
     if user is None:
         raise credentials_exception
     
+    # Cache a detached snapshot so this session's commits cannot expire it
+    snapshot = User(**{column.key: getattr(user, column.key) for column in User.__table__.columns})
+    make_transient_to_detached(snapshot)
+    _user_cache[user_id] = snapshot
     return user
@@ -1,15 +1,23 @@
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
-from typing import List
-import json
+from contextlib import asynccontextmanager
+import asyncio
+import orjson
 
 from app.core.config import settings as app_settings
 from app.core.database import engine, Base
 from app.routers import auth, scans, reports
 from app.routers import settings as settings_router
+from app.services.report_generator import shutdown_report_pool
 
-# Create database tables
-Base.metadata.create_all(bind=engine)
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Create database tables; disable on multi-worker deployments and run once out-of-band
+    if app_settings.RUN_MIGRATIONS:
+        Base.metadata.create_all(bind=engine)
+    yield
+    # PDF rendering runs in its own process pool
+    shutdown_report_pool()
 
 # Initialize FastAPI app
 app = FastAPI(
@@ -17,7 +25,8 @@ app = FastAPI(
     description="S1C0N Security Reconnaissance Platform API",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    lifespan=lifespan
 )
 
 # CORS configuration
@@ -42,24 +51,70 @@ app.include_router(reports.router)
 app.include_router(settings_router.router)
 
 # WebSocket connection manager
+OUTBOUND_QUEUE_SIZE = 32
+
 class ConnectionManager:
     def __init__(self):
-        self.active_connections: dict[int, List[WebSocket]] = {}
+        self.active_connections: dict[int, set[WebSocket]] = {}
+        # Per-connection outbound queue and the relay task draining it
+        self.outbound: dict[WebSocket, tuple[asyncio.Queue, asyncio.Task]] = {}
+        # The event loop only keeps weak references to tasks; hold pending closes until done
+        self.closing: set[asyncio.Task] = set()
 
     async def connect(self, websocket: WebSocket, scan_id: int):
         await websocket.accept()
-        if scan_id not in self.active_connections:
-            self.active_connections[scan_id] = []
-        self.active_connections[scan_id].append(websocket)
+        self.active_connections.setdefault(scan_id, set()).add(websocket)
+
+        queue: asyncio.Queue = asyncio.Queue(maxsize=OUTBOUND_QUEUE_SIZE)
+        task = asyncio.create_task(self._relay(websocket, scan_id, queue))
+        self.outbound[websocket] = (queue, task)
 
     def disconnect(self, websocket: WebSocket, scan_id: int):
-        if scan_id in self.active_connections:
-            self.active_connections[scan_id].remove(websocket)
+        connections = self.active_connections.get(scan_id)
+        if connections is not None:
+            connections.discard(websocket)
+            if not connections:
+                del self.active_connections[scan_id]
+        outbound = self.outbound.pop(websocket, None)
+        if outbound:
+            outbound[1].cancel()
+
+    async def _relay(self, websocket: WebSocket, scan_id: int, queue: asyncio.Queue):
+        """Drain a connection's queue so a slow client only delays itself."""
+        try:
+            while True:
+                payload = await queue.get()
+                await websocket.send_text(payload)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self.disconnect(websocket, scan_id)
 
     async def send_update(self, scan_id: int, data: dict):
-        if scan_id in self.active_connections:
-            for connection in self.active_connections[scan_id]:
-                await connection.send_text(json.dumps(data))
+        connections = list(self.active_connections.get(scan_id, ()))
+        if not connections:
+            return
+
+        payload = orjson.dumps(data).decode()
+        for connection in connections:
+            outbound = self.outbound.get(connection)
+            if outbound is None:
+                continue
+            try:
+                outbound[0].put_nowait(payload)
+            except asyncio.QueueFull:
+                # Client is not keeping up; drop it rather than buffer without bound
+                self.disconnect(connection, scan_id)
+                task = asyncio.create_task(self._close(connection))
+                self.closing.add(task)
+                task.add_done_callback(self.closing.discard)
+
+    @staticmethod
+    async def _close(websocket: WebSocket):
+        try:
+            await websocket.close(code=1013)
+        except Exception:
+            pass
 
 manager = ConnectionManager()
 
@@ -80,8 +135,12 @@ async def websocket_endpoint(websocket: WebSocket, scan_id: int):
     """WebSocket endpoint for real-time scan updates"""
     await manager.connect(websocket, scan_id)
     try:
+        # Updates are server-pushed; inbound frames only keep the socket alive
         while True:
-            data = await websocket.receive_text()
-            await websocket.send_text(f"Received: {data}")
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                break
     except WebSocketDisconnect:
+        pass
+    finally:
         manager.disconnect(websocket, scan_id)
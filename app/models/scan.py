@@ -1,19 +1,52 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, JSON
-from sqlalchemy.orm import relationship
-from datetime import datetime
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, JSON, Index, desc
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import relationship, deferred
+from sqlalchemy.sql.functions import FunctionElement
 from app.core.database import Base
 
+# Binary JSONB on PostgreSQL (the production backend), plain JSON elsewhere
+JSONVariant = JSON().with_variant(JSONB(), "postgresql")
+
+
+class utcnow(FunctionElement):
+    """Current UTC time as a naive timestamp, matching datetime.utcnow() elsewhere."""
+    type = DateTime()
+    inherit_cache = True
+
+
+@compiles(utcnow)
+def _utcnow_default(element, compiler, **kw):
+    # SQLite's CURRENT_TIMESTAMP is already UTC
+    return "CURRENT_TIMESTAMP"
+
+
+@compiles(utcnow, "postgresql")
+def _utcnow_postgresql(element, compiler, **kw):
+    # now() is in the session time zone; convert before dropping the offset
+    return "TIMEZONE('utc', CURRENT_TIMESTAMP)"
+
+
 class Scan(Base):
     __tablename__ = "scans"
+    __table_args__ = (
+        Index("ix_scans_user_created", "user_id", desc("created_at")),
+        Index(
+            "ix_scans_results_gin", "results",
+            postgresql_using="gin",
+            postgresql_ops={"results": "jsonb_path_ops"},
+        ).ddl_if(dialect="postgresql"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     target = Column(String(255), nullable=False)
     scan_type = Column(String(50), default="full")
     status = Column(String(20), default="pending")
-    options = Column(JSON, default={})
-    results = Column(JSON, default={})
-    created_at = Column(DateTime, default=datetime.utcnow)
+    # Large JSON blobs are only loaded when explicitly undeferred or accessed
+    options = deferred(Column(JSONVariant, default={}))
+    results = deferred(Column(JSONVariant, default={}))
+    created_at = Column(DateTime, default=utcnow(), server_default=utcnow(), nullable=False)
     started_at = Column(DateTime, nullable=True)
     completed_at = Column(DateTime, nullable=True)
     progress = Column(Integer, default=0)
@@ -24,6 +57,9 @@ class Scan(Base):
 
 class Report(Base):
     __tablename__ = "reports"
+    __table_args__ = (
+        Index("ix_reports_user_created", "user_id", desc("created_at")),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     scan_id = Column(Integer, ForeignKey("scans.id"), nullable=False)
@@ -32,4 +68,4 @@ class Report(Base):
     file_path = Column(String(500), nullable=False)
     file_size = Column(Integer, default=0)
     format = Column(String(20), default="json")
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, default=utcnow(), server_default=utcnow(), nullable=False)
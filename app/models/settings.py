@@ -4,8 +4,36 @@ Stores user-specific settings including API keys (encrypted).
 """
 from sqlalchemy import Column, Integer, String, ForeignKey, Text
 from sqlalchemy.orm import relationship
+from cryptography.fernet import Fernet, InvalidToken
+from app.core.config import settings
 from app.core.database import Base
 import base64
+import binascii
+import hashlib
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Fernet tokens start with the version byte 0x80, which base64-encodes to "gA"
+_FERNET_PREFIX = "gAAAAA"
+
+
+class ApiKeyStorageUnavailable(RuntimeError):
+    """No persistent encryption key is configured, so API keys cannot be stored."""
+
+
+def _build_cipher():
+    """Cipher derived once from a persistent secret; None if only the generated SECRET_KEY exists."""
+    secret = settings.ENCRYPTION_KEY
+    if not secret and "SECRET_KEY" in settings.model_fields_set:
+        secret = settings.SECRET_KEY
+    if not secret:
+        logger.warning("ENCRYPTION_KEY/SECRET_KEY not configured; Gemini API keys cannot be stored or read")
+        return None
+    return Fernet(base64.urlsafe_b64encode(hashlib.sha256(secret.encode()).digest()))
+
+
+_cipher = _build_cipher()
 
 class UserSettings(Base):
     __tablename__ = "user_settings"
@@ -13,7 +41,7 @@ class UserSettings(Base):
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), unique=True)
     
-    # AI Settings (stored base64 encoded for basic obfuscation)
+    # AI Settings (stored Fernet encrypted)
     gemini_api_key = Column(Text, nullable=True)
     
     # Other settings
@@ -22,14 +50,30 @@ class UserSettings(Base):
     user = relationship("User", back_populates="settings")
     
     def set_api_key(self, key: str):
-        """Encode and store API key."""
+        """Encrypt and store API key."""
         if key:
-            self.gemini_api_key = base64.b64encode(key.encode()).decode()
+            if _cipher is None:
+                raise ApiKeyStorageUnavailable("Set ENCRYPTION_KEY to store API keys")
+            self.gemini_api_key = _cipher.encrypt(key.encode()).decode()
         else:
             self.gemini_api_key = None
     
     def get_api_key(self) -> str:
-        """Decode and return API key."""
-        if self.gemini_api_key:
-            return base64.b64decode(self.gemini_api_key.encode()).decode()
-        return None
+        """Decrypt and return API key."""
+        if not self.gemini_api_key:
+            return None
+        if self.gemini_api_key.startswith(_FERNET_PREFIX):
+            if _cipher is None:
+                logger.warning("Cannot decrypt Gemini API key for user %s: no encryption key configured", self.user_id)
+                return None
+            try:
+                return _cipher.decrypt(self.gemini_api_key.encode()).decode()
+            except InvalidToken:
+                logger.warning("Cannot decrypt Gemini API key for user %s: encryption key has changed", self.user_id)
+                return None
+        # Keys saved before encryption were only base64 encoded
+        try:
+            return base64.b64decode(self.gemini_api_key.encode(), validate=True).decode()
+        except (binascii.Error, UnicodeDecodeError):
+            logger.warning("Stored Gemini API key for user %s is unreadable", self.user_id)
+            return None
@@ -1,19 +1,28 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Query
-from fastapi.responses import StreamingResponse
-from sqlalchemy.orm import Session
-from typing import List, Optional
+from fastapi.responses import Response
+from sqlalchemy import select
+from sqlalchemy.orm import Session, undefer
+from typing import Tuple
 from datetime import datetime
-import io
+import logging
+import re
 
 from app.core.database import get_db
 from app.core.security import get_current_user
 from app.models.user import User
 from app.models.scan import Scan, Report
 from app.models.settings import UserSettings
-from app.services.report_generator import generate_scan_report
+from app.services.report_generator import generate_scan_report_async, has_scan_data
+from app.services.ai_summary import generate_ai_summary
+from app.services.report_cache import make_report_key, get_cached_report, cache_report
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/reports", tags=["Reports"])
 
+FILENAME_TIMESTAMP_FORMAT = "%Y%m%d_%H%M%S"
+_UNSAFE_FILENAME_CHARS = re.compile(r"[^\w.-]")
+
 
 @router.get("/")
 async def list_reports(
@@ -21,32 +30,41 @@ async def list_reports(
     current_user: User = Depends(get_current_user)
 ):
     """Get list of generated reports for current user."""
-    reports = db.query(Report).filter(Report.user_id == current_user.id).order_by(Report.created_at.desc()).all()
+    rows = db.execute(
+        select(Report.id, Report.scan_id, Report.filename, Report.format, Report.file_size, Report.created_at)
+        .where(Report.user_id == current_user.id)
+        .order_by(Report.created_at.desc(), Report.id.desc())
+    ).all()
     return [
         {
-            "id": r.id,
-            "scan_id": r.scan_id,
-            "filename": r.filename,
-            "format": r.format,
-            "file_size": r.file_size,
-            "created_at": r.created_at.isoformat() if r.created_at else None
+            "id": report_id,
+            "scan_id": scan_id,
+            "filename": filename,
+            "format": report_format,
+            "file_size": file_size,
+            "created_at": created_at
         }
-        for r in reports
+        for report_id, scan_id, filename, report_format, file_size, created_at in rows
     ]
 
 
-@router.post("/generate/{scan_id}")
-async def generate_report(
-    scan_id: int,
-    use_ai: bool = Query(default=False, description="Use AI for executive summary"),
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
-):
-    """Generate a PDF report for a specific scan."""
-    # Get scan
-    scan = db.query(Scan).filter(Scan.id == scan_id, Scan.user_id == current_user.id).first()
-    if not scan:
+async def _render_scan_report(db: Session, scan_id: int, current_user: User,
+                              use_ai: bool, appendix: bool) -> Tuple[Scan, bool, bytes]:
+    """
+    Load a completed scan and render its PDF, reusing a cached render when one exists.
+    Returns (scan, used_ai, pdf_bytes); used_ai is False when the AI summary was skipped
+    or fell back to the basic summary.
+    """
+    # Get scan and the owner's settings in one query
+    row = db.execute(
+        select(Scan, UserSettings)
+        .outerjoin(UserSettings, UserSettings.user_id == Scan.user_id)
+        .options(undefer(Scan.results))
+        .where(Scan.id == scan_id, Scan.user_id == current_user.id)
+    ).first()
+    if not row:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Scan not found")
+    scan, user_settings = row
     
     if scan.status != "completed":
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Scan is not completed yet")
@@ -54,7 +72,6 @@ async def generate_report(
     # Get user's API key if using AI
     api_key = None
     if use_ai:
-        user_settings = db.query(UserSettings).filter(UserSettings.user_id == current_user.id).first()
         if user_settings:
             api_key = user_settings.get_api_key()
         
@@ -64,7 +81,6 @@ async def generate_report(
                 detail="Gemini API key not configured. Please add your API key in Settings."
             )
     
-    # Generate PDF
     try:
         scan_data = {
             "id": scan.id,
@@ -75,106 +91,95 @@ async def generate_report(
             "completed_at": scan.completed_at,
             "results": scan.results or {}
         }
+        # Nothing for Gemini to analyse in an empty scan
+        use_ai = use_ai and has_scan_data(scan_data)
         
         user_data = {
             "username": current_user.username,
             "email": current_user.email
         }
         
-        pdf_bytes = generate_scan_report(scan_data, user_data, use_ai=use_ai, api_key=api_key)
-        
-        # Save report to database
-        report_type = "ai" if use_ai else "standard"
-        filename = f"S1C0N_{report_type.upper()}_{scan.target}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf"
-        
-        report = Report(
-            scan_id=scan.id,
-            user_id=current_user.id,
-            filename=filename,
-            file_path=f"/reports/{filename}",
-            file_size=len(pdf_bytes),
-            format="pdf"
-        )
-        db.add(report)
-        db.commit()
-        db.refresh(report)
-        
-        return {
-            "id": report.id,
-            "scan_id": scan.id,
-            "filename": filename,
-            "file_size": len(pdf_bytes),
-            "used_ai": use_ai,
-            "message": "Report generated successfully"
-        }
-        
+        cache_key = make_report_key(scan_data, user_data, use_ai, appendix)
+        pdf_bytes = get_cached_report(cache_key)
+        if pdf_bytes is None:
+            ai_result = await generate_ai_summary(scan_data, api_key) if use_ai else None
+            # A basic-summary fallback is not cached under the AI key so the next request retries Gemini
+            fell_back = ai_result is not None and ai_result.get("fallback", False)
+            pdf_bytes = await generate_scan_report_async(
+                scan_data, user_data, ai_result=ai_result, include_appendix=appendix
+            )
+            if fell_back:
+                use_ai = False
+            else:
+                cache_report(cache_key, pdf_bytes)
     except Exception as e:
+        logger.exception("Failed to generate report for scan %s", scan_id)
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Failed to generate report: {str(e)}")
+    
+    return scan, use_ai, pdf_bytes
+
+
+@router.post("/generate/{scan_id}")
+async def generate_report(
+    scan_id: int,
+    use_ai: bool = Query(default=False, description="Use AI for executive summary"),
+    appendix: bool = Query(default=False, description="Append full port, subdomain and directory lists"),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Generate a PDF report for a specific scan."""
+    scan, use_ai, pdf_bytes = await _render_scan_report(db, scan_id, current_user, use_ai, appendix)
+    
+    # Save report to database
+    report_type = "AI" if use_ai else "STANDARD"
+    safe_target = _UNSAFE_FILENAME_CHARS.sub("_", scan.target)
+    timestamp = datetime.utcnow().strftime(FILENAME_TIMESTAMP_FORMAT)
+    filename = f"S1C0N_{report_type}_{safe_target}_{timestamp}.pdf"
+    
+    report = Report(
+        scan_id=scan.id,
+        user_id=current_user.id,
+        filename=filename,
+        file_path=f"/reports/{filename}",
+        file_size=len(pdf_bytes),
+        format="pdf"
+    )
+    db.add(report)
+    db.commit()
+    db.refresh(report)
+    
+    return {
+        "id": report.id,
+        "scan_id": scan.id,
+        "filename": filename,
+        "file_size": len(pdf_bytes),
+        "used_ai": use_ai,
+        "message": "Report generated successfully"
+    }
 
 
 @router.get("/download/{scan_id}")
 async def download_report(
     scan_id: int,
     use_ai: bool = Query(default=False, description="Use AI for executive summary"),
+    appendix: bool = Query(default=False, description="Append full port, subdomain and directory lists"),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     """Download PDF report for a specific scan."""
-    # Get scan
-    scan = db.query(Scan).filter(Scan.id == scan_id, Scan.user_id == current_user.id).first()
-    if not scan:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Scan not found")
+    scan, use_ai, pdf_bytes = await _render_scan_report(db, scan_id, current_user, use_ai, appendix)
     
-    if scan.status != "completed":
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Scan is not completed yet")
+    report_type = "AI" if use_ai else "STANDARD"
+    safe_target = _UNSAFE_FILENAME_CHARS.sub("_", scan.target)
+    filename = f"S1C0N_{report_type}_{safe_target}_{scan.id}.pdf"
     
-    # Get user's API key if using AI
-    api_key = None
-    if use_ai:
-        user_settings = db.query(UserSettings).filter(UserSettings.user_id == current_user.id).first()
-        if user_settings:
-            api_key = user_settings.get_api_key()
-        
-        if not api_key:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST, 
-                detail="Gemini API key not configured. Please add your API key in Settings."
-            )
-    
-    # Generate PDF on-the-fly
-    try:
-        scan_data = {
-            "id": scan.id,
-            "target": scan.target,
-            "scan_type": scan.scan_type,
-            "status": scan.status,
-            "started_at": scan.started_at,
-            "completed_at": scan.completed_at,
-            "results": scan.results or {}
+    return Response(
+        content=pdf_bytes,
+        media_type="application/pdf",
+        headers={
+            "Content-Disposition": f"attachment; filename={filename}"
         }
-        
-        user_data = {
-            "username": current_user.username,
-            "email": current_user.email
-        }
-        
-        pdf_bytes = generate_scan_report(scan_data, user_data, use_ai=use_ai, api_key=api_key)
-        
-        report_type = "AI" if use_ai else "STANDARD"
-        filename = f"S1C0N_{report_type}_{scan.target}_{scan.id}.pdf"
-        
-        return StreamingResponse(
-            io.BytesIO(pdf_bytes),
-            media_type="application/pdf",
-            headers={
-                "Content-Disposition": f"attachment; filename={filename}"
-            }
-        )
-        
-    except Exception as e:
-        import traceback
-        traceback.print_exc()
-        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Failed to generate report: {str(e)}")
+    )
 
 
 @router.delete("/{report_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -1,5 +1,7 @@
-from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks, Response
+from pydantic import TypeAdapter
+from sqlalchemy import select
+from sqlalchemy.orm import Session, undefer
 from typing import List
 
 from app.core.database import get_db
@@ -11,6 +13,9 @@ from app.services.scanner import run_scan_task
 
 router = APIRouter(prefix="/api/scans", tags=["Scans"])
 
+# Validates and serializes a whole page of rows in one pass
+_scan_list_adapter = TypeAdapter(List[ScanListResponse])
+
 @router.post("/", response_model=ScanResponse, status_code=status.HTTP_201_CREATED)
 async def create_scan(
     scan_data: ScanCreate,
@@ -34,12 +39,19 @@ async def create_scan(
 
 @router.get("/", response_model=List[ScanListResponse])
 async def list_scans(skip: int = 0, limit: int = 20, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
-    scans = db.query(Scan).filter(Scan.user_id == current_user.id).order_by(Scan.created_at.desc()).offset(skip).limit(limit).all()
-    return scans
+    rows = db.execute(
+        select(Scan.id, Scan.target, Scan.scan_type, Scan.status, Scan.created_at)
+        .where(Scan.user_id == current_user.id)
+        .order_by(Scan.created_at.desc(), Scan.id.desc())
+        .offset(skip)
+        .limit(limit)
+    ).all()
+    scans = _scan_list_adapter.validate_python(rows, from_attributes=True)
+    return Response(content=_scan_list_adapter.dump_json(scans), media_type="application/json")
 
 @router.get("/{scan_id}", response_model=ScanResponse)
 async def get_scan(scan_id: int, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
-    scan = db.query(Scan).filter(Scan.id == scan_id, Scan.user_id == current_user.id).first()
+    scan = db.query(Scan).options(undefer(Scan.results)).filter(Scan.id == scan_id, Scan.user_id == current_user.id).first()
     if not scan:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Scan not found")
     return scan
@@ -56,7 +68,7 @@ async def delete_scan(scan_id: int, db: Session = Depends(get_db), current_user:
 @router.post("/{scan_id}/stop", response_model=ScanResponse)
 async def stop_scan(scan_id: int, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
     """Stop a running scan by marking it as cancelled."""
-    scan = db.query(Scan).filter(Scan.id == scan_id, Scan.user_id == current_user.id).first()
+    scan = db.query(Scan).options(undefer(Scan.results)).filter(Scan.id == scan_id, Scan.user_id == current_user.id).first()
     if not scan:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Scan not found")
     
@@ -10,7 +10,7 @@ from typing import Optional
 from app.core.database import get_db
 from app.core.security import get_current_user
 from app.models.user import User
-from app.models.settings import UserSettings
+from app.models.settings import UserSettings, ApiKeyStorageUnavailable
 
 router = APIRouter(prefix="/api/settings", tags=["Settings"])
 
@@ -56,7 +56,13 @@ async def update_settings(
         db.add(settings)
     
     if data.gemini_api_key is not None:
-        settings.set_api_key(data.gemini_api_key)
+        try:
+            settings.set_api_key(data.gemini_api_key)
+        except ApiKeyStorageUnavailable:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="API key storage is not configured on the server"
+            )
     
     db.commit()
     db.refresh(settings)
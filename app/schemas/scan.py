@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from typing import Optional, Dict, Any, List
 from datetime import datetime
 
@@ -32,8 +32,7 @@ class ScanResponse(BaseModel):
     started_at: Optional[datetime]
     completed_at: Optional[datetime]
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, validate_assignment=False)
 
 class ScanListResponse(BaseModel):
     id: int
@@ -41,9 +40,8 @@ class ScanListResponse(BaseModel):
     scan_type: str
     status: str
     created_at: datetime
-    
-    class Config:
-        from_attributes = True
+
+    model_config = ConfigDict(from_attributes=True, validate_assignment=False)
 
 # --- Report Schemas ---
 
@@ -55,5 +53,4 @@ class ReportResponse(BaseModel):
     format: str
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, validate_assignment=False)
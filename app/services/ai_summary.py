@@ -1,58 +1,96 @@
 """
 AI Summary Service - Concise Analysis
 Generates brief executive summary with focus on findings and CVE table.
+google.genai is imported on first Gemini call; PDF render workers only need
+the basic summary and should not pay for loading the SDK.
 """
-from google import genai
-import json
+from cachetools import TTLCache
+from functools import lru_cache
+import asyncio
+import hashlib
+import logging
+import orjson
+
+logger = logging.getLogger(__name__)
+
+# Structured output: Gemini returns JSON matching this schema directly
+RESPONSE_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "summary": {"type": "string"},
+        "findings": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "finding": {"type": "string"},
+                    "severity": {"type": "string", "enum": ["Critical", "High", "Medium", "Low"]},
+                    "cve": {"type": "string"},
+                    "action": {"type": "string"},
+                },
+                "required": ["finding", "severity", "cve", "action"],
+            },
+        },
+    },
+    "required": ["summary", "findings"],
+}
 
-def generate_ai_summary(scan_data: dict, api_key: str = None) -> dict:
-    """
-    Generates a concise executive summary with detailed findings.
-    Returns dict with 'summary' and 'findings' (list for table).
-    """
-    if not api_key:
-        return {
-            "summary": generate_basic_summary(scan_data),
-            "findings": []
-        }
-        
-    try:
-        client = genai.Client(api_key=api_key)
-        
-        target = scan_data.get('target', 'Unknown')
-        results = scan_data.get('results', {})
-        
-        waf = results.get('waf', {})
-        ports = results.get('port', {}).get('open_ports', [])
-        subdomains = results.get('subdo', {}).get('subdomains', [])
-        subdomain_count = results.get('subdo', {}).get('count', 0)
-        cms = results.get('cms', {})
-        tech = results.get('tech', {}).get('technologies', [])
-        directories = results.get('dir', {}).get('directories', [])
-        
-        # Build context
-        ports_info = ", ".join([f"{p.get('port')}/{p.get('service','?')} v{p.get('version','?')}" for p in ports[:10]])
-        tech_info = ", ".join([t.get('name', t) if isinstance(t, dict) else t for t in tech[:8]])
-        dirs_info = ", ".join([d.get('path','') for d in directories[:8]])
-        subdo_info = ", ".join([s.get('subdomain', s) if isinstance(s, dict) else s for s in subdomains[:15]])
-        
-        prompt = f"""You are a security analyst. Analyze this scan of {target}:
 
-WAF: {"Protected by " + waf.get('waf_name', 'Unknown') if waf.get('detected') else "UNPROTECTED"}
+@lru_cache(maxsize=1)
+def _generate_config():
+    """Structured-output config, built once on the first Gemini call."""
+    from google.genai import types
+    return types.GenerateContentConfig(
+        response_mime_type="application/json",
+        response_schema=RESPONSE_SCHEMA,
+    )
+
+
+# Upper bound on Gemini requests in flight from this process
+MAX_CONCURRENT_REQUESTS = 48
+_gemini_semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+
+# Successful results keyed by a digest of the prompt; identical scans reuse them
+AI_CACHE_TTL = 3600  # seconds
+_result_cache: TTLCache = TTLCache(maxsize=1024, ttl=AI_CACHE_TTL)
+
+
+@lru_cache(maxsize=8)
+def _get_client(api_key: str):
+    """Return a shared client per API key so its HTTP connection pool is reused."""
+    from google import genai
+    return genai.Client(api_key=api_key)
+
+
+def _scan_context(scan_data: dict) -> str:
+    """Condense the scan results into the lines sent to Gemini."""
+    results = scan_data.get('results', {})
+    
+    waf = results.get('waf', {})
+    ports = results.get('port', {}).get('open_ports', [])
+    subdomains = results.get('subdo', {}).get('subdomains', [])
+    subdomain_count = results.get('subdo', {}).get('count', 0)
+    cms = results.get('cms', {})
+    tech = results.get('tech', {}).get('technologies', [])
+    directories = results.get('dir', {}).get('directories', [])
+    
+    # Build context
+    ports_info = ", ".join([f"{p.get('port')}/{p.get('service','?')} v{p.get('version','?')}" for p in ports[:10]])
+    tech_info = ", ".join([t.get('name', t) if isinstance(t, dict) else t for t in tech[:8]])
+    dirs_info = ", ".join([d.get('path','') for d in directories[:8]])
+    subdo_info = ", ".join([s.get('subdomain', s) if isinstance(s, dict) else s for s in subdomains[:15]])
+    
+    return f"""WAF: {"Protected by " + waf.get('waf_name', 'Unknown') if waf.get('detected') else "UNPROTECTED"}
 Ports ({len(ports)}): {ports_info or 'None'}
 CMS: {cms.get('cms_name', 'None')} {cms.get('cms_version', '')}
 Tech: {tech_info or 'None'}
 Subdomains ({subdomain_count}): {subdo_info or 'None'}
-Directories: {dirs_info or 'None'}
+Directories: {dirs_info or 'None'}"""
 
-Provide:
 
-1. SUMMARY (3-4 sentences MAX): State overall risk level, main concerns, and action priority. Be direct.
+ANALYSIS_INSTRUCTIONS = """1. summary (3-4 sentences MAX): State overall risk level, main concerns, and action priority. Be direct.
 
-2. FINDINGS (JSON array, focus on actionable items):
-[
-  {{"finding": "Brief description", "severity": "Critical/High/Medium/Low", "cve": "CVE-XXXX-XXXX", "action": "What to do"}}
-]
+2. findings (focus on actionable items): each with a brief finding, severity, CVE id and action.
 
 Include:
 - Known CVEs for detected software versions
@@ -61,46 +99,77 @@ Include:
 - Missing security controls
 - Outdated software
 
-Keep findings SHORT. Max 10 items. Use N/A if no CVE.
+Keep findings SHORT. Max 10 items. Use N/A if no CVE."""
 
-Format exactly:
----SUMMARY---
-[brief summary]
----FINDINGS---
-[json array]"""
-        
-        response = client.models.generate_content(
-            model='gemini-2.5-flash',
-            contents=prompt
-        )
+
+def _build_prompt(scan_data: dict) -> str:
+    """Build the Gemini prompt from the scan results."""
+    target = scan_data.get('target', 'Unknown')
+    
+    return f"""You are a security analyst. Analyze this scan of {target}:
+
+{_scan_context(scan_data)}
+
+Provide:
+
+{ANALYSIS_INSTRUCTIONS}"""
+
+
+def _parse_result(data) -> dict:
+    """Normalize one decoded {summary, findings} object."""
+    summary = str(data.get("summary", "")).strip()[:500]  # Limit length
+    findings = data.get("findings", [])
+    if not isinstance(findings, list):
+        findings = []
+    return {"summary": summary, "findings": findings}
+
+
+def _fallback_result(scan_data: dict) -> dict:
+    """Basic summary used when Gemini is unavailable; 'fallback' marks it as not AI-generated."""
+    return {
+        "summary": generate_basic_summary(scan_data),
+        "findings": [],
+        "fallback": True
+    }
+
+
+async def generate_ai_summary(scan_data: dict, api_key: str = None) -> dict:
+    """
+    Generates a concise executive summary with detailed findings.
+    Returns dict with 'summary' and 'findings' (list for table); 'fallback' is
+    True when Gemini could not be used and the basic summary was returned.
+    Uses the SDK's async client so the request does not tie up a thread.
+    """
+    if not api_key:
+        return _fallback_result(scan_data)
         
-        raw_text = response.text
+    try:
+        client = _get_client(api_key)
         
-        summary = ""
-        findings = []
+        prompt = _build_prompt(scan_data)
+        cache_key = hashlib.blake2b(prompt.encode(), digest_size=16).hexdigest()
+        cached = _result_cache.get(cache_key)
+        if cached is not None:
+            return cached
         
-        if "---SUMMARY---" in raw_text and "---FINDINGS---" in raw_text:
-            parts = raw_text.split("---FINDINGS---")
-            summary = parts[0].replace("---SUMMARY---", "").strip()[:500]  # Limit length
-            
-            if len(parts) > 1:
-                try:
-                    start = parts[1].find('[')
-                    end = parts[1].rfind(']') + 1
-                    if start != -1 and end > start:
-                        findings = json.loads(parts[1][start:end])
-                except:
-                    pass
-        else:
-            summary = raw_text[:400]
+        async with _gemini_semaphore:
+            response = await client.aio.models.generate_content(
+                model='gemini-2.5-flash',
+                contents=prompt,
+                config=_generate_config()
+            )
         
-        return {"summary": summary, "findings": findings}
+        result = _parse_result(orjson.loads(response.text))
+        _result_cache[cache_key] = result
+        return result
         
-    except Exception as e:
-        return {
-            "summary": generate_basic_summary(scan_data),
-            "findings": []
-        }
+    except (ValueError, AttributeError):
+        # orjson.JSONDecodeError is a ValueError; a non-object body raises AttributeError
+        logger.warning("Gemini returned malformed JSON for scan %s; using basic summary", scan_data.get('id'))
+        return _fallback_result(scan_data)
+    except Exception:
+        logger.exception("Gemini summary failed for scan %s; using basic summary", scan_data.get('id'))
+        return _fallback_result(scan_data)
 
 
 def generate_basic_summary(scan_data: dict) -> str:
@@ -110,7 +179,12 @@ def generate_basic_summary(scan_data: dict) -> str:
     ports = results.get('port', {}).get('open_ports', [])
     subdo = results.get('subdo', {}).get('count', 0)
     
-    status = "Protected" if waf.get('detected') else "Unprotected"
-    risk_ports = len([p for p in ports if p.get('risk') == 'high'])
+    risk_ports = sum(1 for p in ports if p.get('risk') == 'high')
     
-    return f"Target is {status}. Found {len(ports)} ports ({risk_ports} high-risk), {subdo} subdomains."
+    return _summary_core(bool(waf.get('detected')), len(ports), risk_ports, subdo)
+
+
+@lru_cache(maxsize=512)
+def _summary_core(waf_detected: bool, port_count: int, high_risk_count: int, subdo_count: int) -> str:
+    status = "Protected" if waf_detected else "Unprotected"
+    return f"Target is {status}. Found {port_count} ports ({high_risk_count} high-risk), {subdo_count} subdomains."
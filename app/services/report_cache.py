@@ -0,0 +1,53 @@
+"""
+Report Cache Service
+In-memory LRU cache for rendered PDF reports, bounded by entry count and total bytes.
+"""
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+MAX_ENTRIES = 128
+MAX_BYTES = 64 * 1024 * 1024  # 64 MB
+
+_cache: "OrderedDict[tuple, bytes]" = OrderedDict()
+_cache_bytes = 0
+_lock = threading.Lock()
+
+
+def make_report_key(scan_data: Dict[str, Any], user_data: Dict[str, Any], use_ai: bool,
+                    appendix: bool = False) -> tuple:
+    """Build a hashable cache key from the scan identity, render options and a digest of its contents."""
+    payload = json.dumps([scan_data, user_data], sort_keys=True, default=str).encode()
+    digest = hashlib.blake2b(payload, digest_size=16).hexdigest()
+    return (scan_data.get('id'), use_ai, appendix, str(scan_data.get('completed_at')), digest)
+
+
+def get_cached_report(key: tuple) -> Optional[bytes]:
+    """Return cached PDF bytes for key, or None on a miss."""
+    with _lock:
+        pdf_bytes = _cache.get(key)
+        if pdf_bytes is not None:
+            _cache.move_to_end(key)
+        return pdf_bytes
+
+
+def cache_report(key: tuple, pdf_bytes: bytes) -> None:
+    """Store PDF bytes under key, evicting least recently used entries over budget."""
+    global _cache_bytes
+    size = len(pdf_bytes)
+    if size > MAX_BYTES:
+        return
+
+    with _lock:
+        old = _cache.pop(key, None)
+        if old is not None:
+            _cache_bytes -= len(old)
+
+        _cache[key] = pdf_bytes
+        _cache_bytes += size
+
+        while len(_cache) > MAX_ENTRIES or _cache_bytes > MAX_BYTES:
+            _, evicted = _cache.popitem(last=False)
+            _cache_bytes -= len(evicted)
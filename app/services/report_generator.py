@@ -8,43 +8,115 @@ Features:
 
 import os
 import io
+import asyncio
+import copy
+import itertools
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
-from typing import Dict, Any
+from xml.sax.saxutils import escape
+from typing import Dict, Any, Iterable, List, Optional, Sequence
+
+# Graphics shape attribute validation is a development aid. rl_config reads RL_* overrides
+# once, when reportlab is first imported, and spawned render workers inherit the environment.
+os.environ.setdefault('RL_shapeChecking', '0')
+
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import A4
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch, mm
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, HRFlowable, Image, PageBreak
+from reportlab.lib.utils import ImageReader
+from reportlab.platypus import SimpleDocTemplate, Paragraph, Preformatted, Spacer, Table, LongTable, TableStyle, HRFlowable, Flowable, PageBreak
 from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
+from PIL import Image as PILImage
 
-from app.services.ai_summary import generate_ai_summary, generate_basic_summary
-from app.services.chart_generator import create_findings_bar_chart
+from app.core.config import settings
+from app.services.ai_summary import generate_basic_summary
+from app.services.chart_generator import create_findings_bar_drawing
+
+logger = logging.getLogger(__name__)
 
 # Colors
-BLACK = colors.Color(0, 0, 0)
-GREEN = colors.Color(37/255, 211/255, 102/255)
-DARK_GREEN = colors.Color(6/255, 30/255, 15/255)
-WHITE = colors.Color(240/255, 255/255, 240/255)
-GRAY = colors.Color(100/255, 100/255, 100/255)
-RED = colors.Color(255/255, 82/255, 82/255)
-ORANGE = colors.Color(255/255, 165/255, 0/255)
-YELLOW = colors.Color(255/255, 235/255, 59/255)
+BLACK = colors.HexColor(0x000000)
+GREEN = colors.HexColor(0x25D366)
+DARK_GREEN = colors.HexColor(0x061E0F)
+WHITE = colors.HexColor(0xF0FFF0)
+GRAY = colors.HexColor(0x646464)
+RED = colors.HexColor(0xFF5252)
+ORANGE = colors.HexColor(0xFFA500)
+YELLOW = colors.HexColor(0xFFEB3B)
+
+# Severity -> text colour for the AI findings table
+SEVERITY_COLORS = {'critical': RED, 'high': ORANGE, 'medium': YELLOW}
 
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 LOGO_PATH = os.path.join(BASE_DIR, "web", "src", "assets", "logo.png")
 
+LOGO_JPEG_QUALITY = 90
+
+
+def _load_logo() -> Optional[ImageReader]:
+    """
+    Flatten the logo onto the black cover and re-encode it as JPEG once, so every
+    report embeds it as-is (DCTDecode) instead of recompressing RGB plus an alpha mask.
+    """
+    if not os.path.exists(LOGO_PATH):
+        return None
+    try:
+        with PILImage.open(LOGO_PATH) as im:
+            im = im.convert('RGBA')
+            flat = PILImage.new('RGB', im.size, (0, 0, 0))
+            flat.paste(im, mask=im.getchannel('A'))
+        buf = io.BytesIO()
+        flat.save(buf, format='JPEG', quality=LOGO_JPEG_QUALITY)
+        buf.seek(0)
+        return ImageReader(buf)
+    except (OSError, ValueError):
+        logger.warning("Cannot load report logo %s; rendering reports without it", LOGO_PATH, exc_info=True)
+        return None
+
+
+_LOGO_READER = _load_logo()
+
+
+class CachedImage(Flowable):
+    """Image flowable drawn from a shared ImageReader, scaled proportionally to fit width x height."""
+
+    def __init__(self, reader: ImageReader, width: float, height: float):
+        super().__init__()
+        img_width, img_height = reader.getSize()
+        scale = min(width / img_width, height / img_height)
+        self.reader = reader
+        self.drawWidth = img_width * scale
+        self.drawHeight = img_height * scale
+
+    def wrap(self, availWidth, availHeight):
+        return self.drawWidth, self.drawHeight
+
+    def draw(self):
+        self.canv.drawImage(self.reader, 0, 0, self.drawWidth, self.drawHeight, mask='auto')
+
+
+CONTENT_BACKGROUND_FORM = "contentBackground"
+
 
 def add_background(canvas, doc):
     """Background template for content pages."""
     canvas.saveState()
-    canvas.setFillColor(BLACK)
-    canvas.rect(0, 0, A4[0], A4[1], fill=1)
-    
-    # Simple border for content pages
-    canvas.setStrokeColor(GREEN)
-    canvas.setLineWidth(1)
-    m = 10 * mm
-    canvas.rect(m, m, A4[0] - 2*m, A4[1] - 2*m)
+    # Static fill and border are recorded once per document as a form XObject
+    if not canvas.hasForm(CONTENT_BACKGROUND_FORM):
+        canvas.beginForm(CONTENT_BACKGROUND_FORM)
+        canvas.setFillColor(BLACK)
+        canvas.rect(0, 0, A4[0], A4[1], fill=1, stroke=0)
+        
+        # Simple border for content pages
+        canvas.setStrokeColor(GREEN)
+        canvas.setLineWidth(1)
+        m = 10 * mm
+        canvas.rect(m, m, A4[0] - 2*m, A4[1] - 2*m)
+        canvas.endForm()
+    canvas.doForm(CONTENT_BACKGROUND_FORM)
     
     # Page number
     page_num = canvas.getPageNumber()
@@ -60,7 +132,7 @@ def add_cover_background(canvas, doc):
     """Background template specifically for the cover page."""
     canvas.saveState()
     canvas.setFillColor(BLACK)
-    canvas.rect(0, 0, A4[0], A4[1], fill=1)
+    canvas.rect(0, 0, A4[0], A4[1], fill=1, stroke=0)
     
     # Neon corner accents
     canvas.setStrokeColor(GREEN)
@@ -79,7 +151,7 @@ def add_cover_background(canvas, doc):
     canvas.restoreState()
 
 
-def create_styles():
+def _build_styles():
     styles = getSampleStyleSheet()
     # Updated text styles for better theme matching
     styles.add(ParagraphStyle('CoverTitle', fontName='Courier-Bold', fontSize=26, textColor=GREEN, alignment=TA_CENTER, spaceAfter=20, leading=32))
@@ -92,63 +164,242 @@ def create_styles():
     styles.add(ParagraphStyle('SHeading', fontName='Helvetica-Bold', fontSize=12, textColor=GREEN, spaceBefore=15, spaceAfter=8))
     styles.add(ParagraphStyle('SBody', fontName='Courier', fontSize=9, textColor=WHITE, leading=12, spaceAfter=4))
     styles.add(ParagraphStyle('SSmall', fontName='Courier', fontSize=7, textColor=GRAY, alignment=TA_CENTER))
-    styles.add(ParagraphStyle('SCell', fontName='Courier', fontSize=8, textColor=WHITE, leading=10, wordWrap='CJK'))
+    # Plain cells wrap on spaces (long tokens are still split); CJK wrapping only for non-ASCII text
+    styles.add(ParagraphStyle('SCell', fontName='Courier', fontSize=8, textColor=WHITE, leading=10))
+    styles.add(ParagraphStyle('SCellCJK', parent=styles['SCell'], wordWrap='CJK'))
     return styles
 
 
+# Paragraph and table styles are only read while building, so one set serves every report
+_STYLES = _build_styles()
+
+_INFO_TABLE_STYLE = TableStyle([
+    ('TEXTCOLOR', (0, 0), (-1, -1), GRAY),
+    ('FONTNAME', (0, 0), (-1, -1), 'Courier'),
+    ('FONTSIZE', (0, 0), (-1, -1), 8),
+    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+    ('LINEBELOW', (0, 0), (-1, -1), 0.5, GREEN),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 10),
+])
+
+_SUMMARY_BOX_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, -1), DARK_GREEN),
+    ('BOX', (0, 0), (-1, -1), 1, GREEN),
+    ('LEFTPADDING', (0, 0), (-1, -1), 10),
+    ('RIGHTPADDING', (0, 0), (-1, -1), 10),
+    ('TOPPADDING', (0, 0), (-1, -1), 10),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 10),
+])
+
+# Findings table commands; per-row severity colours are added per report
+_FINDINGS_BASE_STYLE = (
+    ('GRID', (0, 0), (-1, -1), 0.5, GREEN),
+    ('BACKGROUND', (0, 0), (-1, 0), GREEN),
+    ('TEXTCOLOR', (0, 0), (-1, 0), BLACK),
+    ('FONTNAME', (0, 0), (-1, 0), 'Courier-Bold'),
+    ('FONTSIZE', (0, 0), (-1, -1), 8),
+    ('TEXTCOLOR', (0, 1), (-1, -1), WHITE),
+    ('BACKGROUND', (0, 1), (-1, -1), BLACK),
+    ('TOPPADDING', (0, 0), (-1, -1), 4),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 4),
+    ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+)
+
+
+def create_styles():
+    return _STYLES
+
+
+# Fixed text parsed into Paragraphs once; reports get shallow copies that share the parsed frags
+_STATIC_PARAGRAPHS = {
+    text: Paragraph(text, _STYLES[style])
+    for text, style in (
+        ("/// SYSTEM_REPORT_GENERATED ///", 'SSmall'),
+        ("SECURITY ASSESSMENT", 'CoverTitle'),
+        ("[ CONFIDENTIAL REPORT ]", 'CoverSubtitle'),
+        ("TARGET ASSET", 'CoverLabel'),
+        ("ASSESSMENT DATE", 'CoverLabel'),
+        ("PREPARED FOR", 'CoverLabel'),
+        ("REFERENCE ID", 'CoverLabel'),
+        ("CONFIDENTIAL DOCUMENT", 'SSmall'),
+        ("No scan data available.", 'SBody'),
+        ("GENERATED BY S1C0N PLATFORM", 'SSmall'),
+    )
+}
+
+
+def _static(text: str) -> Paragraph:
+    return copy.copy(_STATIC_PARAGRAPHS[text])
+
+
+def _cell(text: Any, limit: int) -> Paragraph:
+    """Wrapped table cell; truncated before escaping so wrapping work stays bounded."""
+    text = str(text or '')[:limit]
+    return Paragraph(escape(text), _STYLES['SCell' if text.isascii() else 'SCellCJK'])
+
+
+# Column widths are shared across reports; Table copies them before adjusting
+INFO_COL_WIDTHS = (150, 200, 150)
+SUMMARY_COL_WIDTHS = (480,)
+FINDINGS_COL_WIDTHS = (120, 45, 110, 205)
+WAF_COL_WIDTHS = (100, 380)
+TECH_COL_WIDTHS = (80, 400)
+WP_INFO_COL_WIDTHS = (120, 360)
+WP_PLUGIN_COL_WIDTHS = (180, 100, 80, 60)
+WP_THEME_COL_WIDTHS = (250, 100, 80)
+WP_USER_COL_WIDTHS = (60, 420)
+WP_VULN_COL_WIDTHS = (120, 280, 80)
+
+PORT_HEADER = ["Port", "Service", "Version", "Risk"]
+PORT_COL_WIDTHS = (70, 100, 210, 100)
+SUBDOMAIN_HEADER = ["#", "Subdomain"]
+SUBDOMAIN_COL_WIDTHS = (40, 440)
+DIR_HEADER = ["Status", "Path", "Severity"]
+DIR_COL_WIDTHS = (60, 330, 90)
+
+# Rows shown in the main sections; the rest go to the optional appendix
+MAX_PORT_ROWS = 24
+MAX_SUBDOMAIN_ROWS = 60
+MAX_DIR_ROWS = 30
+
+
+def _port_row(p: Dict[str, Any]) -> List[str]:
+    return [
+        f"{p.get('port')}/{p.get('protocol', 'tcp')}",
+        p.get('service', '?'),
+        (p.get('version', '') or '')[:25],
+        p.get('risk', 'low').upper()
+    ]
+
+
+def _subdomain_row(i: int, s: Any) -> List[str]:
+    return [str(i), (s.get('subdomain', s) if isinstance(s, dict) else s)[:50]]
+
+
+def _dir_row(d: Dict[str, Any]) -> List[str]:
+    return [
+        str(d.get('status', '?')),
+        str(d.get('path', ''))[:45],
+        str(d.get('severity', 'info')).upper()
+    ]
+
+
+class LazyTable(Flowable):
+    """
+    Table that pulls its rows from an iterator one page at a time, so long
+    appendices never hold every row (or one huge Table) in memory.
+    """
+
+    def __init__(self, header: List[str], rows: Iterable[List[str]], colWidths: Sequence[float]):
+        super().__init__()
+        self.header = header
+        self.rows = iter(rows)
+        self.colWidths = colWidths
+        self._pending = next(self.rows, None)
+
+    def _table(self, data: List[List[str]]) -> LongTable:
+        table = LongTable(data, colWidths=self.colWidths, repeatRows=1)
+        table.setStyle(simple_table_style(header=True))
+        return table
+
+    def wrap(self, availWidth, availHeight):
+        # Claim more than the frame has so it always asks us to split
+        return availWidth, availHeight + 1
+
+    def split(self, availWidth, availHeight):
+        if self._pending is None:
+            return []
+        # Rows are single-line, so one header + row probe gives the row height
+        _, probe_height = self._table([self.header, self._pending]).wrap(availWidth, availHeight)
+        fit = int(availHeight // (probe_height / 2)) - 1
+        if fit < 1:
+            return []
+        table = self._table([self.header, self._pending, *itertools.islice(self.rows, fit - 1)])
+        # The remainder shares the iterator; a fresh flowable keeps platypus' postpone state clean
+        rest = LazyTable(self.header, self.rows, self.colWidths)
+        return [table] if rest._pending is None else [table, rest]
+
+    def draw(self):
+        pass
+
+
+def has_scan_data(scan_data: Dict[str, Any]) -> bool:
+    """True if the scan found anything worth charting or summarising."""
+    results = scan_data.get('results') or {}
+    return any([
+        results.get('port', {}).get('open_ports'),
+        results.get('subdo', {}).get('count'),
+        results.get('dir', {}).get('directories'),
+        results.get('tech', {}).get('technologies'),
+        results.get('waf', {}).get('detected'),
+        results.get('cms', {}).get('detected'),
+        results.get('wp', {}).get('wordpress_detected'),
+    ])
+
+
 def generate_scan_report(scan_data: Dict[str, Any], user_data: Dict[str, Any], 
-                         use_ai: bool = False, api_key: str = None) -> bytes:
+                         ai_result: Optional[Dict[str, Any]] = None,
+                         include_appendix: bool = False) -> io.BytesIO:
+    """
+    Render the PDF report. `ai_result` is the output of generate_ai_summary for AI reports.
+    `include_appendix` adds full port, subdomain and directory lists beyond the section caps.
+    Returns the rewound BytesIO buffer.
+    """
+    is_empty = not has_scan_data(scan_data)
+    use_ai = ai_result is not None and not is_empty
     buffer = io.BytesIO()
-    doc = SimpleDocTemplate(buffer, pagesize=A4, 
+    doc = SimpleDocTemplate(buffer, pagesize=A4, pageCompression=1,
         rightMargin=15*mm, leftMargin=15*mm, topMargin=15*mm, bottomMargin=15*mm)
     
-    styles = create_styles()
+    styles = _STYLES
     story = []
+    now = datetime.now()
+    results = scan_data.get('results') or {}
+    ports = results.get('port', {}).get('open_ports') or []
+    subs = results.get('subdo', {}).get('subdomains') or []
+    dirs = results.get('dir', {}).get('directories') or []
     
     # --- COVER PAGE ---
     story.append(Spacer(1, 40*mm))
     
     # Large Logo
-    try:
-        if os.path.exists(LOGO_PATH):
-            img = Image(LOGO_PATH, width=4*inch, height=2*inch, kind='proportional')
-            img.hAlign = 'CENTER'
-            story.append(img)
-            story.append(Spacer(1, 15*mm))
-    except:
-        pass
-        
+    if _LOGO_READER is not None:
+        img = CachedImage(_LOGO_READER, width=4*inch, height=2*inch)
+        img.hAlign = 'CENTER'
+        story.append(img)
+        story.append(Spacer(1, 15*mm))
+    
     # Decorative terminal-style separator
-    story.append(Paragraph("/// SYSTEM_REPORT_GENERATED ///", styles['SSmall']))
+    story.append(_static("/// SYSTEM_REPORT_GENERATED ///"))
     story.append(Spacer(1, 10))
     
-    story.append(Paragraph("SECURITY ASSESSMENT", styles['CoverTitle']))
-    story.append(Paragraph("[ CONFIDENTIAL REPORT ]", styles['CoverSubtitle']))
+    story.append(_static("SECURITY ASSESSMENT"))
+    story.append(_static("[ CONFIDENTIAL REPORT ]"))
     
     story.append(Spacer(1, 15*mm))
     
     # Scan Details Block
     target = scan_data.get('target', 'N/A').upper()
-    scan_date = datetime.now().strftime("%B %d, %Y")
+    scan_date = now.strftime("%B %d, %Y")
     analyst = user_data.get('username', 'Unknown').upper()
     scan_id = str(scan_data.get('id', 'N/A'))
     
-    story.append(Paragraph("TARGET ASSET", styles['CoverLabel']))
-    story.append(Paragraph(target, styles['CoverValue']))
+    story.append(_static("TARGET ASSET"))
+    story.append(Paragraph(escape(target), styles['CoverValue']))
     
-    story.append(Paragraph("ASSESSMENT DATE", styles['CoverLabel']))
+    story.append(_static("ASSESSMENT DATE"))
     story.append(Paragraph(scan_date, styles['CoverValue']))
     
-    story.append(Paragraph("PREPARED FOR", styles['CoverLabel']))
-    story.append(Paragraph(analyst, styles['CoverValue']))
+    story.append(_static("PREPARED FOR"))
+    story.append(Paragraph(escape(analyst), styles['CoverValue']))
     
-    story.append(Paragraph("REFERENCE ID", styles['CoverLabel']))
+    story.append(_static("REFERENCE ID"))
     story.append(Paragraph(f"SCAN-{scan_id}", styles['CoverValue']))
     
     story.append(Spacer(1, 30*mm))
     story.append(HRFlowable(width="60%", thickness=1, color=GREEN))
     story.append(Spacer(1, 5*mm))
-    story.append(Paragraph("CONFIDENTIAL DOCUMENT", styles['SSmall']))
+    story.append(_static("CONFIDENTIAL DOCUMENT"))
     
     story.append(PageBreak())
     
@@ -156,155 +407,118 @@ def generate_scan_report(scan_data: Dict[str, Any], user_data: Dict[str, Any],
     
     # Info Header (Small)
     info_table = Table([
-        [f"SCAN: #{scan_id}", f"TARGET: {target}", f"DATE: {datetime.now().strftime('%Y-%m-%d')}"]
-    ], colWidths=[150, 200, 150])
-    info_table.setStyle(TableStyle([
-        ('TEXTCOLOR', (0, 0), (-1, -1), GRAY),
-        ('FONTNAME', (0, 0), (-1, -1), 'Courier'),
-        ('FONTSIZE', (0, 0), (-1, -1), 8),
-        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-        ('LINEBELOW', (0, 0), (-1, -1), 0.5, GREEN),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 10),
-    ]))
+        [f"SCAN: #{scan_id}", f"TARGET: {target}", f"DATE: {now.strftime('%Y-%m-%d')}"]
+    ], colWidths=INFO_COL_WIDTHS)
+    info_table.setStyle(_INFO_TABLE_STYLE)
     story.append(info_table)
     story.append(Spacer(1, 20))
 
     # Executive Summary
     ai_findings = []
-    if use_ai and api_key:
-        ai_result = generate_ai_summary(scan_data, api_key)
+    if use_ai:
         summary_text = ai_result.get("summary", "")
         ai_findings = ai_result.get("findings", [])
-        story.append(Paragraph("EXECUTIVE SUMMARY", styles['SHeading']))
+        summary_heading = "EXECUTIVE SUMMARY"
     else:
         summary_text = generate_basic_summary(scan_data)
-        story.append(Paragraph("SUMMARY", styles['SHeading']))
+        summary_heading = "SUMMARY"
     
-    summary_box = Table([[Paragraph(summary_text, styles['SBody'])]], colWidths=[480])
-    summary_box.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, -1), DARK_GREEN),
-        ('BOX', (0, 0), (-1, -1), 1, GREEN),
-        ('LEFTPADDING', (0, 0), (-1, -1), 10),
-        ('RIGHTPADDING', (0, 0), (-1, -1), 10),
-        ('TOPPADDING', (0, 0), (-1, -1), 10),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 10),
-    ]))
-    story.append(summary_box)
-    story.append(Spacer(1, 20))
+    # Skip the box entirely rather than laying out an empty one
+    if summary_text:
+        story.append(Preformatted(summary_heading, styles['SHeading']))
+        summary_box = Table([[Paragraph(escape(summary_text), styles['SBody'])]], colWidths=SUMMARY_COL_WIDTHS)
+        summary_box.setStyle(_SUMMARY_BOX_STYLE)
+        story.append(summary_box)
+        story.append(Spacer(1, 20))
     
     # Findings Table
     if use_ai and ai_findings:
-        story.append(Paragraph("KEY FINDINGS & RECOMMENDATIONS", styles['SHeading']))
+        story.append(Preformatted("KEY FINDINGS & RECOMMENDATIONS", styles['SHeading']))
         
         data = [["FINDING", "SEV", "CVE", "ACTION"]]
-        for f in ai_findings[:12]:
-            finding = str(f.get('finding', ''))
-            sev = str(f.get('severity', 'Info'))[:10]
-            cve = str(f.get('cve', 'N/A'))
-            action = str(f.get('action', f.get('recommendation', '')))
+        severity_styles = []
+        for row_idx, f in enumerate(ai_findings[:12], 1):
+            severity = str(f.get('severity', 'Info'))
+            cve = f.get('cve') or 'N/A'
+            if isinstance(cve, (list, tuple)):
+                cve = ', '.join(map(str, cve))
             data.append([
-                Paragraph(finding, styles['SCell']),
-                sev,
-                Paragraph(cve, styles['SCell']),
-                Paragraph(action, styles['SCell'])
+                _cell(f.get('finding'), 160),
+                severity[:10],
+                _cell(cve, 120),
+                _cell(f.get('action') or f.get('recommendation'), 240)
             ])
-        
-        ft = Table(data, colWidths=[120, 45, 110, 205])
-        style_list = [
-            ('GRID', (0, 0), (-1, -1), 0.5, GREEN),
-            ('BACKGROUND', (0, 0), (-1, 0), GREEN),
-            ('TEXTCOLOR', (0, 0), (-1, 0), BLACK),
-            ('FONTNAME', (0, 0), (-1, 0), 'Courier-Bold'),
-            ('FONTSIZE', (0, 0), (-1, -1), 8),
-            ('TEXTCOLOR', (0, 1), (-1, -1), WHITE),
-            ('BACKGROUND', (0, 1), (-1, -1), BLACK),
-            ('TOPPADDING', (0, 0), (-1, -1), 4),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 4),
-            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-        ]
-        for i, f in enumerate(ai_findings[:12], 1):
-            sev = str(f.get('severity', '')).lower()
-            if 'critical' in sev:
-                style_list.append(('TEXTCOLOR', (1, i), (1, i), RED))
-            elif 'high' in sev:
-                style_list.append(('TEXTCOLOR', (1, i), (1, i), ORANGE))
-            elif 'medium' in sev:
-                style_list.append(('TEXTCOLOR', (1, i), (1, i), YELLOW))
-                
-        ft.setStyle(TableStyle(style_list))
+            # Key on the first word so values like "High (CVSS 8.1)" still get coloured
+            sev_words = severity.split(None, 1)
+            sev_color = SEVERITY_COLORS.get(sev_words[0].lower()) if sev_words else None
+            if sev_color is not None:
+                severity_styles.append(('TEXTCOLOR', (1, row_idx), (1, row_idx), sev_color))
+
+        ft = Table(data, colWidths=FINDINGS_COL_WIDTHS)
+        ft.setStyle(TableStyle([*_FINDINGS_BASE_STYLE, *severity_styles]))
         story.append(ft)
         story.append(Spacer(1, 20))
         
-    # Chart
-    try:
-        bar_buf = create_findings_bar_chart(scan_data)
-        chart = Image(bar_buf, width=4*inch, height=1.6*inch)
-        chart.hAlign = 'CENTER'
-        story.append(Paragraph("SCAN STATISTICS", styles['SHeading']))
-        story.append(chart)
+    if is_empty:
+        story.append(_static("No scan data available."))
         story.append(Spacer(1, 20))
-    except:
-        pass
+    else:
+        # Chart; None when there are no counts to plot
+        chart = None
+        try:
+            chart = create_findings_bar_drawing(scan_data, width=4*inch, height=1.6*inch)
+        except Exception:
+            logger.exception("Failed to build scan statistics chart for scan %s", scan_data.get('id'))
+        if chart is not None:
+            chart.hAlign = 'CENTER'
+            story.append(Preformatted("SCAN STATISTICS", styles['SHeading']))
+            story.append(chart)
+            story.append(Spacer(1, 20))
 
-    results = scan_data.get('results', {})
-    
-    # WAF
-    if 'waf' in results:
-        waf = results['waf']
-        story.append(Paragraph("WAF PROTECTION", styles['SHeading']))
+    # WAF; a failed probe says nothing about protection, so it gets no section
+    waf = results.get('waf')
+    if waf and not waf.get('error'):
+        story.append(Preformatted("WAF PROTECTION", styles['SHeading']))
         wt = Table([
             ["Status", "PROTECTED" if waf.get('detected') else "EXPOSED"],
             ["Technology", waf.get('waf_name', 'N/A') or 'N/A'],
-        ], colWidths=[100, 380])
+        ], colWidths=WAF_COL_WIDTHS)
         wt.setStyle(simple_table_style())
         story.append(wt)
         story.append(Spacer(1, 15))
 
     # Ports
-    if 'port' in results:
-        ports = results['port'].get('open_ports', [])
-        if ports:
-            story.append(Paragraph(f"OPEN PORTS ({len(ports)})", styles['SHeading']))
-            for chunk_start in range(0, min(len(ports), 24), 12):
-                chunk = ports[chunk_start:chunk_start+12]
-                pd = [["Port", "Service", "Version", "Risk"]]
-                for p in chunk:
-                    pd.append([
-                        f"{p.get('port')}/{p.get('protocol', 'tcp')}",
-                        p.get('service', '?'),
-                        (p.get('version', '') or '')[:25],
-                        p.get('risk', 'low').upper()
-                    ])
-                pt = Table(pd, colWidths=[70, 100, 210, 100])
-                pt.setStyle(simple_table_style(header=True))
-                story.append(pt)
-                story.append(Spacer(1, 5))
-            story.append(Spacer(1, 15))
+    if ports:
+        story.append(Preformatted(f"OPEN PORTS ({len(ports)})", styles['SHeading']))
+        port_rows = [_port_row(p) for p in ports[:MAX_PORT_ROWS]]
+        # One LongTable; ReportLab splits it by row across pages and repeats the header
+        pt = LongTable([PORT_HEADER] + port_rows,
+                   colWidths=PORT_COL_WIDTHS, repeatRows=1, splitByRow=1)
+        pt.setStyle(simple_table_style(header=True))
+        story.append(pt)
+        if len(ports) > MAX_PORT_ROWS:
+            hidden = len(ports) - MAX_PORT_ROWS
+            suffix = " (see appendix)" if include_appendix else ""
+            story.append(Spacer(1, 5))
+            story.append(Paragraph(f"... and {hidden} more ports{suffix}", styles['SSmall']))
+        story.append(Spacer(1, 20))
 
     # Subdomains
-    if 'subdo' in results:
-        subs = results['subdo'].get('subdomains', [])
-        count = results['subdo'].get('count', 0)
-        if subs:
-            story.append(Paragraph(f"SUBDOMAINS ({count})", styles['SHeading']))
-            max_subs = min(len(subs), 60)
-            for chunk_start in range(0, max_subs, 20):
-                chunk = subs[chunk_start:chunk_start+20]
-                sd = [["#", "Subdomain"]]
-                for i, s in enumerate(chunk, chunk_start + 1):
-                    name = s.get('subdomain', s) if isinstance(s, dict) else s
-                    sd.append([str(i), name[:50]])
-                st = Table(sd, colWidths=[40, 440])
-                st.setStyle(simple_table_style(header=(chunk_start == 0)))
-                story.append(st)
-                story.append(Spacer(1, 5))
-            if len(subs) > 60:
-                story.append(Paragraph(f"... {len(subs)-60} more hidden", styles['SSmall']))
-            story.append(Spacer(1, 15))
+    if subs:
+        story.append(Preformatted(f"SUBDOMAINS ({results['subdo'].get('count', 0)})", styles['SHeading']))
+        sub_rows = [_subdomain_row(i, s) for i, s in enumerate(subs[:MAX_SUBDOMAIN_ROWS], 1)]
+        st = LongTable([SUBDOMAIN_HEADER] + sub_rows, colWidths=SUBDOMAIN_COL_WIDTHS, repeatRows=1, splitByRow=1)
+        st.setStyle(simple_table_style(header=True))
+        story.append(st)
+        story.append(Spacer(1, 5))
+        if len(subs) > MAX_SUBDOMAIN_ROWS:
+            hidden = len(subs) - MAX_SUBDOMAIN_ROWS
+            note = f"... {hidden} more in the appendix" if include_appendix else f"... {hidden} more hidden"
+            story.append(Paragraph(note, styles['SSmall']))
+        story.append(Spacer(1, 15))
 
     # Tech
     if 'tech' in results or 'cms' in results:
-        story.append(Paragraph("TECHNOLOGIES", styles['SHeading']))
         td = [["Type", "Name"]]
         if results.get('cms', {}).get('detected'):
             cms = results['cms']
@@ -312,44 +526,36 @@ def generate_scan_report(scan_data: Dict[str, Any], user_data: Dict[str, Any],
         for t in results.get('tech', {}).get('technologies', [])[:10]:
             name = t.get('name', t) if isinstance(t, dict) else t
             td.append(["Stack", str(name)[:50]])
+        # Heading and spacing only when there is something to list
         if len(td) > 1:
-            tt = Table(td, colWidths=[80, 400])
+            story.append(Preformatted("TECHNOLOGIES", styles['SHeading']))
+            tt = Table(td, colWidths=TECH_COL_WIDTHS)
             tt.setStyle(simple_table_style(header=True))
             story.append(tt)
-        story.append(Spacer(1, 15))
+            story.append(Spacer(1, 15))
 
     # Directories
-    if 'dir' in results:
-        dirs = results['dir'].get('directories', [])
-        if dirs:
-            story.append(Paragraph(f"DIRECTORIES ({len(dirs)})", styles['SHeading']))
-            
-            # Limit and chunk
-            max_dirs = min(len(dirs), 30)
-            for chunk_start in range(0, max_dirs, 15):
-                chunk = dirs[chunk_start:chunk_start+15]
-                dd = [["Status", "Path", "Severity"]]
-                for d in chunk:
-                    dd.append([
-                        str(d.get('status', '?')),
-                        str(d.get('path', ''))[:45],
-                        str(d.get('severity', 'info')).upper()
-                    ])
-                dt = Table(dd, colWidths=[60, 330, 90])
-                dt.setStyle(simple_table_style(header=(chunk_start == 0)))
-                story.append(dt)
-                if chunk_start + 15 < max_dirs:
-                    story.append(Spacer(1, 4))
-            
-            if len(dirs) > 30:
-                story.append(Paragraph(f"... and {len(dirs) - 30} more directories", styles['SSmall']))
-            story.append(Spacer(1, 15))
+    if dirs:
+        story.append(Preformatted(f"DIRECTORIES ({len(dirs)})", styles['SHeading']))
+        
+        # Limit and normalize
+        dir_rows = [_dir_row(d) for d in dirs[:MAX_DIR_ROWS]]
+        dt = LongTable([DIR_HEADER] + dir_rows,
+                   colWidths=DIR_COL_WIDTHS, repeatRows=1, splitByRow=1)
+        dt.setStyle(simple_table_style(header=True))
+        story.append(dt)
+        
+        if len(dirs) > MAX_DIR_ROWS:
+            hidden = len(dirs) - MAX_DIR_ROWS
+            suffix = " (see appendix)" if include_appendix else ""
+            story.append(Paragraph(f"... and {hidden} more directories{suffix}", styles['SSmall']))
+        story.append(Spacer(1, 15))
 
     # WordPress Enumeration
     if 'wp' in results:
         wp = results['wp']
         if wp.get('wordpress_detected'):
-            story.append(Paragraph("WORDPRESS ENUMERATION", styles['SHeading']))
+            story.append(Preformatted("WORDPRESS ENUMERATION", styles['SHeading']))
             
             # WP Info table
             wp_info = [
@@ -357,7 +563,7 @@ def generate_scan_report(scan_data: Dict[str, Any], user_data: Dict[str, Any],
                 ["WordPress Detected", "Yes"],
                 ["Version", wp.get('version', 'Unknown') or 'Unknown'],
             ]
-            wpt = Table(wp_info, colWidths=[120, 360])
+            wpt = Table(wp_info, colWidths=WP_INFO_COL_WIDTHS)
             wpt.setStyle(simple_table_style(header=True))
             story.append(wpt)
             story.append(Spacer(1, 10))
@@ -365,7 +571,7 @@ def generate_scan_report(scan_data: Dict[str, Any], user_data: Dict[str, Any],
             # Plugins
             plugins = wp.get('plugins', [])
             if plugins:
-                story.append(Paragraph(f"Plugins ({len(plugins)})", styles['SBody']))
+                story.append(Preformatted(f"Plugins ({len(plugins)})", styles['SBody']))
                 pd = [["Plugin", "Version", "Outdated", "Vulns"]]
                 for p in plugins[:15]:
                     pd.append([
@@ -374,7 +580,7 @@ def generate_scan_report(scan_data: Dict[str, Any], user_data: Dict[str, Any],
                         "Yes" if p.get('outdated') else "No",
                         str(p.get('vulnerabilities', 0))
                     ])
-                pt = Table(pd, colWidths=[180, 100, 80, 60])
+                pt = Table(pd, colWidths=WP_PLUGIN_COL_WIDTHS)
                 pt.setStyle(simple_table_style(header=True))
                 story.append(pt)
                 story.append(Spacer(1, 8))
@@ -382,7 +588,7 @@ def generate_scan_report(scan_data: Dict[str, Any], user_data: Dict[str, Any],
             # Themes
             themes = wp.get('themes', [])
             if themes:
-                story.append(Paragraph(f"Themes ({len(themes)})", styles['SBody']))
+                story.append(Preformatted(f"Themes ({len(themes)})", styles['SBody']))
                 td = [["Theme", "Version", "Outdated"]]
                 for t in themes[:10]:
                     td.append([
@@ -390,7 +596,7 @@ def generate_scan_report(scan_data: Dict[str, Any], user_data: Dict[str, Any],
                         str(t.get('version', '?'))[:15],
                         "Yes" if t.get('outdated') else "No"
                     ])
-                tt = Table(td, colWidths=[250, 100, 80])
+                tt = Table(td, colWidths=WP_THEME_COL_WIDTHS)
                 tt.setStyle(simple_table_style(header=True))
                 story.append(tt)
                 story.append(Spacer(1, 8))
@@ -398,11 +604,11 @@ def generate_scan_report(scan_data: Dict[str, Any], user_data: Dict[str, Any],
             # Users
             users = wp.get('users', [])
             if users:
-                story.append(Paragraph(f"Enumerated Users ({len(users)})", styles['SBody']))
+                story.append(Preformatted(f"Enumerated Users ({len(users)})", styles['SBody']))
                 ud = [["ID", "Username"]]
                 for u in users[:20]:
                     ud.append([str(u.get('id', '?')), str(u.get('username', ''))[:40]])
-                ut = Table(ud, colWidths=[60, 420])
+                ut = Table(ud, colWidths=WP_USER_COL_WIDTHS)
                 ut.setStyle(simple_table_style(header=True))
                 story.append(ut)
                 story.append(Spacer(1, 8))
@@ -410,7 +616,7 @@ def generate_scan_report(scan_data: Dict[str, Any], user_data: Dict[str, Any],
             # Vulnerabilities
             vulns = wp.get('vulnerabilities', [])
             if vulns:
-                story.append(Paragraph(f"Known Vulnerabilities ({len(vulns)})", styles['SBody']))
+                story.append(Preformatted(f"Known Vulnerabilities ({len(vulns)})", styles['SBody']))
                 vd = [["Component", "Title", "Severity"]]
                 for v in vulns[:10]:
                     vd.append([
@@ -418,24 +624,81 @@ def generate_scan_report(scan_data: Dict[str, Any], user_data: Dict[str, Any],
                         str(v.get('title', ''))[:35],
                         str(v.get('severity', 'medium')).upper()
                     ])
-                vt = Table(vd, colWidths=[120, 280, 80])
+                vt = Table(vd, colWidths=WP_VULN_COL_WIDTHS)
                 vt.setStyle(simple_table_style(header=True))
                 story.append(vt)
             
             story.append(Spacer(1, 15))
 
+    # Appendix: full lists, laid out a page at a time
+    if include_appendix:
+        appendix = [
+            (f"ALL OPEN PORTS ({len(ports)})", PORT_HEADER, PORT_COL_WIDTHS,
+             len(ports) > MAX_PORT_ROWS, (_port_row(p) for p in ports)),
+            (f"ALL SUBDOMAINS ({len(subs)})", SUBDOMAIN_HEADER, SUBDOMAIN_COL_WIDTHS,
+             len(subs) > MAX_SUBDOMAIN_ROWS, (_subdomain_row(i, s) for i, s in enumerate(subs, 1))),
+            (f"ALL DIRECTORIES ({len(dirs)})", DIR_HEADER, DIR_COL_WIDTHS,
+             len(dirs) > MAX_DIR_ROWS, (_dir_row(d) for d in dirs)),
+        ]
+        appendix = [section for section in appendix if section[3]]
+        if appendix:
+            story.append(PageBreak())
+            story.append(Preformatted("APPENDIX", styles['SHeading']))
+            for title, header, col_widths, _, rows in appendix:
+                story.append(Preformatted(title, styles['SHeading']))
+                story.append(LazyTable(header, rows, col_widths))
+                story.append(Spacer(1, 15))
+
     # Footer
     story.append(Spacer(1, 20))
     story.append(HRFlowable(width="100%", thickness=0.5, color=GREEN))
-    story.append(Paragraph(f"GENERATED BY S1C0N PLATFORM", styles['SSmall']))
+    story.append(_static("GENERATED BY S1C0N PLATFORM"))
 
     # Build with dual template (Cover vs Content)
     doc.build(story, onFirstPage=add_cover_background, onLaterPages=add_background)
     buffer.seek(0)
-    return buffer.getvalue()
+    return buffer
 
 
-def simple_table_style(header=False):
+# Worker processes for rendering; created on first use
+_process_pool: Optional[ProcessPoolExecutor] = None
+
+
+def _render_report_bytes(scan_data: Dict[str, Any], user_data: Dict[str, Any],
+                         ai_result: Optional[Dict[str, Any]], include_appendix: bool) -> bytes:
+    return generate_scan_report(
+        scan_data, user_data, ai_result=ai_result, include_appendix=include_appendix
+    ).getvalue()
+
+
+async def generate_scan_report_async(scan_data: Dict[str, Any], user_data: Dict[str, Any],
+                                     ai_result: Optional[Dict[str, Any]] = None,
+                                     include_appendix: bool = False) -> bytes:
+    """
+    Render the PDF in a worker process so concurrent reports run in parallel
+    instead of contending for the GIL. Returns the PDF bytes.
+    """
+    global _process_pool
+    if _process_pool is None:
+        # spawn: forking the multi-threaded server process is not safe
+        _process_pool = ProcessPoolExecutor(
+            max_workers=settings.REPORT_WORKERS,
+            mp_context=multiprocessing.get_context("spawn")
+        )
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _process_pool, _render_report_bytes, scan_data, user_data, ai_result, include_appendix
+    )
+
+
+def shutdown_report_pool():
+    global _process_pool
+    if _process_pool is not None:
+        _process_pool.shutdown(wait=False, cancel_futures=True)
+        _process_pool = None
+
+
+def _build_simple_table_style(header=False):
     style = [
         ('GRID', (0, 0), (-1, -1), 0.5, GREEN),
         ('FONTNAME', (0, 0), (-1, -1), 'Courier'),
@@ -453,3 +716,12 @@ def simple_table_style(header=False):
             ('FONTNAME', (0, 0), (-1, 0), 'Courier-Bold'),
         ])
     return TableStyle(style)
+
+
+# Shared, immutable once built; reused by every table in every report
+_SIMPLE_TABLE_STYLE = _build_simple_table_style()
+_SIMPLE_TABLE_STYLE_HEADER = _build_simple_table_style(header=True)
+
+
+def simple_table_style(header=False):
+    return _SIMPLE_TABLE_STYLE_HEADER if header else _SIMPLE_TABLE_STYLE
@@ -189,7 +189,7 @@ def run_waf_scan(target: str, proxy: Optional[str] = None, user_agent: Optional[
             if not host:
                 # Fallback to https if httprobe fails
                 host = f"https://{target}"
-        except:
+        except (OSError, ValueError, subprocess.SubprocessError):
             # Fallback to trying both protocols
             host = f"https://{target}"
         
@@ -326,7 +326,7 @@ def run_subdomain_scan(target: str, proxy: Optional[str] = None, user_agent: Opt
                 all_subdomains.add(line.strip().lower())
         if proc.returncode == 0:
             result["sources"].append("subfinder")
-    except:
+    except (OSError, ValueError, subprocess.SubprocessError):
         pass
     
     # Run assetfinder
@@ -340,7 +340,7 @@ def run_subdomain_scan(target: str, proxy: Optional[str] = None, user_agent: Opt
                 all_subdomains.add(line.strip().lower())
         if proc.returncode == 0:
             result["sources"].append("assetfinder")
-    except:
+    except (OSError, ValueError, subprocess.SubprocessError):
         pass
     
     # Categorize subdomains
@@ -392,7 +392,7 @@ def run_cms_detection(target: str, proxy: Optional[str] = None, user_agent: Opti
         url = f"https://{target}"
         try:
             resp = requests.get(url, headers=headers, timeout=15, proxies=proxies, verify=False, allow_redirects=True)
-        except:
+        except requests.RequestException:
             url = f"http://{target}"
             resp = requests.get(url, headers=headers, timeout=15, proxies=proxies, verify=False, allow_redirects=True)
         
@@ -496,7 +496,7 @@ def run_tech_detection(target: str, proxy: Optional[str] = None, user_agent: Opt
         url = f"https://{target}"
         try:
             resp = requests.get(url, headers=headers, timeout=20, proxies=proxies, verify=False, allow_redirects=True)
-        except:
+        except requests.RequestException:
             url = f"http://{target}"
             resp = requests.get(url, headers=headers, timeout=20, proxies=proxies, verify=False, allow_redirects=True)
         
@@ -715,7 +715,7 @@ def run_wp_enum(target: str, proxy: Optional[str] = None, user_agent: Optional[s
         url = f"https://{target}"
         try:
             resp = requests.get(url, headers=headers, timeout=15, proxies=proxies, verify=False, allow_redirects=True)
-        except:
+        except requests.RequestException:
             url = f"http://{target}"
             resp = requests.get(url, headers=headers, timeout=15, proxies=proxies, verify=False, allow_redirects=True)
         
@@ -773,7 +773,7 @@ def run_wp_enum(target: str, proxy: Optional[str] = None, user_agent: Optional[s
                         
                         if plugin_info["version"]:
                             break
-                except:
+                except requests.RequestException:
                     continue
             
             # Check latest version from wordpress.org (core logic from cek_db.py)
@@ -787,7 +787,7 @@ def run_wp_enum(target: str, proxy: Optional[str] = None, user_agent: Optional[s
                             latest_version = latest_match.group(1)
                             if plugin_info["version"] < latest_version:
                                 plugin_info["outdated"] = True
-                except:
+                except requests.RequestException:
                     pass
             
             # Check for vulnerabilities (simplified from cek_vuln.py)
@@ -811,12 +811,12 @@ def run_wp_enum(target: str, proxy: Optional[str] = None, user_agent: Optional[s
                                         "type": "unknown",
                                         "severity": "high" if "critical" in title.lower() else "medium"
                                     })
-                            except:
+                            except ValueError:
                                 continue
                         
                         plugin_info["vulnerabilities"] = vuln_count
                         plugin_info["vulnerable"] = vuln_count > 0
-                except:
+                except requests.RequestException:
                     pass
             
             result["plugins"].append(plugin_info)
@@ -837,7 +837,7 @@ def run_wp_enum(target: str, proxy: Optional[str] = None, user_agent: Optional[s
                     version_match = re.search(r'Version:\s*([\d.]+)', sresp.text)
                     if version_match:
                         theme_info["version"] = version_match.group(1)
-            except:
+            except requests.RequestException:
                 pass
             
             result["themes"].append(theme_info)
@@ -853,7 +853,7 @@ def run_wp_enum(target: str, proxy: Optional[str] = None, user_agent: Optional[s
                         "id": user.get("id"),
                         "username": user.get("slug") or user.get("name", "")
                     })
-        except:
+        except (requests.RequestException, ValueError, TypeError, AttributeError):
             # Fallback: Try author archive enumeration
             for i in range(1, 11):
                 try:
@@ -867,7 +867,7 @@ def run_wp_enum(target: str, proxy: Optional[str] = None, user_agent: Optional[s
                                 "id": i,
                                 "username": author_match.group(1)
                             })
-                except:
+                except requests.RequestException:
                     continue
         
     except requests.RequestException as e: